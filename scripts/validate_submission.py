@@ -14,36 +14,123 @@ Workflow:
 Status values: pending, in-progress, submitted, validated, approved, done, deferred, cancelled, blocked
 """
 
+from __future__ import annotations
+
+import os
+import re
+import contextlib
+import functools
 import sys
 import json
+import uuid
+import zipfile
 import logging
+import logging.handlers
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Tuple, Any
-import pandas as pd
-import openpyxl
-from openpyxl import load_workbook
-from openpyxl.utils import get_column_letter
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, BinaryIO, Dict, FrozenSet, Iterable, List, Optional, Tuple, Any, Union
+
+# pandas/numpy/openpyxl are imported where validation actually runs, so the
+# CLI starts (and reports usage errors) without paying their import cost
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import orjson  # Optional: faster JSON report encoding
+except ImportError:
+    orjson = None
 
 # Configure logging
+# The log file is opened on first write; batch runs put a buffer in front of it
+# (see _buffered_log_file)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+_file_handler = logging.FileHandler('validation.log', delay=True)
+_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler('validation.log'),
+        _file_handler,
         logging.StreamHandler(sys.stdout)
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Buffer in front of the log file while validate_batch runs, None otherwise
+_log_buffer = None
+
+
+@contextlib.contextmanager
+def _buffered_log_file():
+    """Route validation.log through a buffer flushed every 1000 records and on errors
+
+    Only used for batch runs, which log a line per file; a long-running process
+    (the portal) keeps writing the file unbuffered so no records wait in memory.
+    """
+    global _log_buffer
+    root = logging.getLogger()
+    if _file_handler not in root.handlers:
+        # Logging was configured by the host application; leave it alone
+        yield
+        return
+
+    _log_buffer = logging.handlers.MemoryHandler(
+        capacity=1000, flushLevel=logging.ERROR, target=_file_handler
+    )
+    root.removeHandler(_file_handler)
+    root.addHandler(_log_buffer)
+    try:
+        yield
+    finally:
+        root.removeHandler(_log_buffer)
+        _log_buffer.close()  # Flushes the remaining records
+        _log_buffer = None
+        root.addHandler(_file_handler)
+
+# Recorded in every report as metadata.validator_version
+VALIDATOR_VERSION = "1.0"
+
 # Validation thresholds
 COMPLETENESS_TARGET = 0.95  # 95% of required fields
 ENHANCEMENT_MIN_ORGS = 30  # Minimum enhanced CORDIS orgs
 ENHANCEMENT_MIN_FIELDS = 3  # Minimum fields per enhanced org
 NEW_ORGS_MIN = 10  # Minimum new organizations
 
+# Messages kept per list in a report; the rest collapse into one summary line
+MAX_REPORT_MESSAGES = 500
+
+# Patterns for URL / email format checks (compiled once at import).
+# Both are anchored so every field can be checked with Series.str.match.
+_URL_RE = re.compile(r'^https?://', re.IGNORECASE)
+_EMAIL_RE = re.compile(r'^[^@]*@')
+
+# Text format checks: field -> (pattern, warning suffix)
+_FORMAT_CHECKS = {
+    "Website": (_URL_RE, "entries missing http:// or https://"),
+    "Email": (_EMAIL_RE, "entries missing '@' symbol"),
+    "Contact_Email": (_EMAIL_RE, "entries missing '@' symbol"),
+}
+
+
+@dataclass(frozen=True)
+class TemplateSchema:
+    """Immutable description of one submission template"""
+    __slots__ = ("required_fields", "optional_fields", "dropdowns",
+                 "sheet_name", "two_tab", "enhancement_targets")
+
+    required_fields: Tuple[str, ...]
+    optional_fields: Tuple[str, ...]
+    dropdowns: Dict[str, FrozenSet[str]]
+    sheet_name: str
+    two_tab: bool
+    enhancement_targets: Optional[Dict[str, int]]
+
+
 # Template schemas with required fields
-TEMPLATE_SCHEMAS = {
+_RAW_SCHEMAS = {
     "1_Organization_Registry": {
         "required_fields": [
             "Organization_ID", "Organization_Name", "Type", "Country", "NUTS2_Region",
@@ -205,14 +292,85 @@ TEMPLATE_SCHEMAS = {
     }
 }
 
+TEMPLATE_SCHEMAS = {
+    name: TemplateSchema(
+        required_fields=tuple(raw["required_fields"]),
+        optional_fields=tuple(raw["optional_fields"]),
+        dropdowns={field: frozenset(values) for field, values in raw["dropdowns"].items()},
+        sheet_name=raw["sheet_name"],
+        two_tab=raw["two_tab"],
+        enhancement_targets=raw.get("enhancement_targets"),
+    )
+    for name, raw in _RAW_SCHEMAS.items()
+}
+
+# Filename prefix (template number) -> template name
+_PREFIX_TO_TEMPLATE = {name.split('_', 1)[0]: name for name in TEMPLATE_SCHEMAS}
+_TEMPLATE_NUMBER_RE = re.compile(r'\d+')
+
+
+@functools.lru_cache(maxsize=None)
+def _calamine():
+    """The python_calamine module (fast Excel reader), or None if it is not installed"""
+    try:
+        import python_calamine
+    except ImportError:
+        return None
+    return python_calamine
+
+
+# Excel error cells (#REF!, #N/A, ...) in worksheet XML: <c ... t="e">
+_ERROR_CELL_RE = re.compile(rb"""\bt=["']e["']""")
+
+
+def _has_error_cells(source: Union[Path, BinaryIO]) -> bool:
+    """True if any worksheet of the workbook holds an Excel error value
+
+    calamine returns error cells as empty strings, which would hide broken
+    formulas from the dropdown and completeness checks.
+    """
+    try:
+        with zipfile.ZipFile(source) as zf:
+            return any(
+                _ERROR_CELL_RE.search(zf.read(name))
+                for name in zf.namelist()
+                if name.startswith("xl/worksheets/") and name.endswith(".xml")
+            )
+    except (zipfile.BadZipFile, OSError, KeyError):
+        return False  # Let the reader report the broken file
+    finally:
+        if hasattr(source, "seek"):
+            source.seek(0)
+
+
+def _from_calamine(cell: Any) -> Any:
+    """Convert a calamine cell value to the value openpyxl yields for it"""
+    if isinstance(cell, str):
+        return cell if cell else None
+    if isinstance(cell, float):
+        # openpyxl yields int for whole numbers written without an exponent
+        return int(cell) if cell.is_integer() and abs(cell) < 1e16 else cell
+    if type(cell) is date:
+        # openpyxl yields datetime for every date cell
+        return datetime(cell.year, cell.month, cell.day)
+    return cell
+
 
 class SubmissionValidator:
     """Validates partner data submissions"""
 
-    def __init__(self, file_path: Path):
-        self.file_path = Path(file_path)
+    def __init__(self, source: Union[str, Path, BinaryIO],
+                 max_errors: Optional[int] = MAX_REPORT_MESSAGES):
+        if isinstance(source, (str, Path)):
+            self.file_path = source if isinstance(source, Path) else Path(source)
+            self.source = self.file_path
+        else:
+            # In-memory file (e.g. an upload): the template is identified from its name
+            self.file_path = Path(getattr(source, "name", ""))
+            self.source = source
         self.template_type = self._identify_template()
-        self.schema = TEMPLATE_SCHEMAS.get(self.template_type, {})
+        self.schema = TEMPLATE_SCHEMAS.get(self.template_type)
+        self.max_errors = max_errors
         self.errors = []
         self.warnings = []
         self.metadata = {}
@@ -221,101 +379,206 @@ class SubmissionValidator:
     def _identify_template(self) -> str:
         """Identify template type from filename"""
         filename = self.file_path.name
-        for template_name in TEMPLATE_SCHEMAS.keys():
-            if filename.startswith(template_name.split('_')[0]):
-                return template_name
-        raise ValueError(f"Unknown template type: {filename}")
+        # Match the whole leading number, so "10_..." is not taken for template 1
+        prefix = _TEMPLATE_NUMBER_RE.match(filename)
+        template_name = _PREFIX_TO_TEMPLATE.get(prefix.group() if prefix else None)
+        if template_name is None:
+            raise ValueError(f"Unknown template type: {filename}")
+        return template_name
 
     def validate(self) -> Dict[str, Any]:
         """Run all validation checks"""
         logger.info(f"Validating {self.file_path.name}...")
 
-        # Load workbook
-        try:
-            wb = load_workbook(self.file_path, data_only=True)
-        except Exception as e:
-            self.errors.append(f"Failed to load file: {str(e)}")
+        if self.schema is None:
+            self.errors.append(f"No schema defined for template '{self.template_type}'")
             return self._generate_report()
 
-        # Get the correct worksheet
-        sheet_name = self.schema.get("sheet_name", "Sheet1")
-        if sheet_name not in wb.sheetnames:
-            self.errors.append(f"Expected worksheet '{sheet_name}' not found")
+        # Extract data as DataFrame (errors are recorded by the loader). The
+        # workbook is opened once here; every check below works on this frame
+        # calamine cannot report error cells, so such workbooks go through openpyxl
+        if _calamine() is not None and not _has_error_cells(self.source):
+            df = self._load_with_calamine(self.schema.sheet_name)
+        else:
+            df = self._load_with_openpyxl(self.schema.sheet_name)
+        if df is None:
             return self._generate_report()
 
-        ws = wb[sheet_name]
-
-        # Extract data as DataFrame
-        try:
-            df = self._worksheet_to_dataframe(ws)
-        except Exception as e:
-            self.errors.append(f"Failed to parse worksheet: {str(e)}")
+        # Nothing to check in an empty template
+        if df.empty:
+            self.errors.append("Worksheet contains no data rows")
             return self._generate_report()
 
         # Run validation checks
-        self._check_schema_compliance(df)
+        columns = frozenset(df.columns)
+        self._check_schema_compliance(df, columns)
         self._check_data_types(df)
-        self._check_completeness(df)
+        self._check_completeness(df, columns)
         self._check_dropdown_values(df)
         self._check_quality_metrics(df)
 
         # Special handling for Organization Registry (two-tab template)
-        if self.template_type == "1_Organization_Registry" and self.schema.get("two_tab"):
+        if self.template_type == "1_Organization_Registry" and self.schema.two_tab:
             self._check_enhancement_targets(df)
 
         # Generate validation report
         return self._generate_report()
 
-    def _worksheet_to_dataframe(self, ws) -> pd.DataFrame:
-        """Convert worksheet to pandas DataFrame"""
+    def _load_with_calamine(self, sheet_name: str) -> Optional[pd.DataFrame]:
+        """Read the template worksheet with the Rust-based calamine reader"""
+        try:
+            wb = _calamine().CalamineWorkbook.from_object(self.source)
+        except Exception as e:
+            self.errors.append(f"Failed to load file: {str(e)}")
+            return None
+
+        try:
+            # Get the correct worksheet
+            if sheet_name not in wb.sheet_names:
+                self.errors.append(f"Expected worksheet '{sheet_name}' not found")
+                return None
+
+            try:
+                sheet = wb.get_sheet_by_name(sheet_name)
+                # Read the grid from A1 (like openpyxl). calamine reports empty cells as '',
+                # numbers as floats and date-only cells as date; normalise to openpyxl's values
+                rows = (
+                    tuple(map(_from_calamine, row))
+                    for row in sheet.to_python(skip_empty_area=False)
+                )
+                return self._worksheet_to_dataframe(rows)
+            except Exception as e:
+                self.errors.append(f"Failed to parse worksheet: {str(e)}")
+                return None
+        finally:
+            # Release the workbook as soon as the sheet has been read
+            wb.close()
+
+    def _load_with_openpyxl(self, sheet_name: str) -> Optional[pd.DataFrame]:
+        """Read the template worksheet with openpyxl in read-only mode"""
+        from openpyxl import load_workbook
+
+        # Load workbook (read-only: rows are streamed instead of building every cell object)
+        try:
+            wb = load_workbook(self.source, data_only=True, read_only=True)
+        except Exception as e:
+            self.errors.append(f"Failed to load file: {str(e)}")
+            return None
+
+        try:
+            # Get the correct worksheet
+            if sheet_name not in wb.sheetnames:
+                self.errors.append(f"Expected worksheet '{sheet_name}' not found")
+                return None
+
+            ws = wb[sheet_name]
+
+            # Ignore the file's dimension tag, which may be missing or wrong; rows
+            # then stream at their actual (ragged) length
+            ws.reset_dimensions()
+
+            try:
+                return self._worksheet_to_dataframe(ws.iter_rows(values_only=True))
+            except Exception as e:
+                self.errors.append(f"Failed to parse worksheet: {str(e)}")
+                return None
+        finally:
+            # Release the underlying zip file handle
+            wb.close()
+
+    def _worksheet_to_dataframe(self, rows: Iterable[tuple]) -> pd.DataFrame:
+        """Convert worksheet rows to pandas DataFrame in a single forward pass"""
+        import numpy as np
+        import pandas as pd
+
         data = []
         headers = []
-        header_row_num = 0
+        # Non-empty rows seen while looking for the header, kept so the fallback
+        # header can be applied without re-reading the sheet
+        candidates = []
 
-        # Find header row (look for row with field names like Organization_ID, etc.)
-        # Skip merged cells and instructions
-        for idx, row in enumerate(ws.iter_rows(min_row=1, max_row=50, values_only=True), 1):
+        rows = iter(rows)
+        for idx, row in enumerate(rows, 1):
             if not any(row):
                 continue
 
-            # Check if this looks like a header row
+            if idx > 50:
+                # No header row found within the first 50 rows
+                headers, data = self._fallback_header(candidates)
+                data.append(row)
+                break
+
+            # Find header row (look for row with field names like Organization_ID, etc.)
+            # Skip merged cells and instructions
             # Header rows typically contain "_ID" or multiple capitalized words with underscores
             row_str = ' '.join([str(cell) for cell in row if cell])
             if ('_ID' in row_str or '_Name' in row_str or
                 ('Organization' in row_str and 'Type' in row_str)):
-                headers = [str(cell).strip() if cell else f"Column_{i}"
-                          for i, cell in enumerate(row)]
-                header_row_num = idx
+                headers = self._row_to_headers(row)
                 break
 
-        if not headers:
-            # Fallback: use first non-empty row
-            for idx, row in enumerate(ws.iter_rows(min_row=1, max_row=20, values_only=True), 1):
-                if any(row):
-                    headers = [str(cell).strip() if cell else f"Column_{i}"
-                              for i, cell in enumerate(row)]
-                    header_row_num = idx
-                    break
-
-        # Get data rows after header
-        for row in ws.iter_rows(min_row=header_row_num + 1, values_only=True):
-            if any(row):  # Skip empty rows
-                # Skip rows that appear to be section headers or duplicated headers
-                first_cell = str(row[0]) if row[0] else ""
-                if not first_cell.startswith('SECTION') and '*' not in first_cell:
-                    data.append(row)
-
-        df = pd.DataFrame(data, columns=headers[:len(data[0]) if data else 0])
+            candidates.append((idx, row))
+        else:
+            # Sheet ended before a header row was found
+            headers, data = self._fallback_header(candidates)
+
+        # Get data rows after header from the rest of the stream
+        data.extend(rows)
+
+        # Fit every row to the header width: trailing columns beyond the last named
+        # header are dropped (sheet dimensions often overstate width) and short rows
+        # are padded (rows are ragged when the sheet's dimensions were reset)
+        width = len(headers) if headers else max(map(len, data), default=0)
+        padding = (None,) * width
+        data = [row[:width] if len(row) >= width else (*row, *padding[len(row):])
+                for row in data]
+
+        # Build an all-object frame: the checks coerce values themselves, so pandas'
+        # per-column dtype inference would be wasted work
+        if data:
+            values = np.array(data, dtype=object)
+            # Empty-string cells (cleared cells, formulas yielding "") count as empty,
+            # so rows made only of them are dropped below like blank rows
+            values[values == ""] = None
+        else:
+            values = np.empty((0, 0), dtype=object)
+        df = pd.DataFrame(values, columns=headers[:values.shape[1]])
+
+        # Skip empty rows and rows that appear to be section headers or duplicated headers
+        df = df.dropna(how='all')
+        if not df.empty:
+            first_col = df.iloc[:, 0].astype(str)
+            section_rows = (first_col.str.startswith('SECTION') |
+                            first_col.str.contains('*', regex=False))
+            df = df[~section_rows]
+        df = df.reset_index(drop=True)
 
         # Clean column names - remove asterisks and strip whitespace
         df.columns = df.columns.str.replace('*', '', regex=False).str.strip()
 
         return df
 
-    def _check_schema_compliance(self, df: pd.DataFrame):
+    def _fallback_header(self, candidates: List[Tuple[int, tuple]]) -> Tuple[List[str], List[tuple]]:
+        """Use the first non-empty row (within the first 20) as header; the rest are data"""
+        if candidates and candidates[0][0] <= 20:
+            headers = self._row_to_headers(candidates[0][1])
+            candidates = candidates[1:]
+        else:
+            headers = []
+        return headers, [row for _, row in candidates]
+
+    @staticmethod
+    def _row_to_headers(row: tuple) -> List[str]:
+        """Build column names from a header row, naming blank cells by position"""
+        # Trailing empty cells are not columns
+        width = max((i for i, cell in enumerate(row, 1) if cell is not None), default=0)
+        return [str(cell).strip() if cell else f"Column_{i}" for i, cell in enumerate(row[:width])]
+
+    def _check_schema_compliance(self, df: pd.DataFrame, columns: frozenset):
         """Check if all required fields are present"""
-        required_fields = self.schema.get("required_fields", [])
-        missing_fields = [field for field in required_fields if field not in df.columns]
+        required_fields = list(self.schema.required_fields)
+        missing_fields = [field for field in required_fields if field not in columns]
+        present_fields = [field for field in required_fields if field in columns]
 
         if missing_fields:
             self.errors.append(
@@ -325,12 +588,15 @@ class SubmissionValidator:
         self.validation_results["schema_compliance"] = {
             "required_fields": required_fields,
             "missing_fields": missing_fields,
-            "present_fields": [f for f in required_fields if f in df.columns],
+            "present_fields": present_fields,
             "status": "PASS" if not missing_fields else "FAIL"
         }
 
     def _check_data_types(self, df: pd.DataFrame):
         """Validate data types for specific fields"""
+        import numpy as np
+        import pandas as pd
+
         type_errors = []
 
         # Check numeric fields
@@ -339,67 +605,64 @@ class SubmissionValidator:
 
         for field in numeric_fields:
             if field in df.columns:
-                non_numeric = df[~pd.to_numeric(df[field], errors='coerce').notna() &
-                                df[field].notna()][field]
-                if len(non_numeric) > 0:
+                col = df[field]
+                coerced_isna = pd.to_numeric(col, errors='coerce').isna().to_numpy()
+                non_numeric_count = int(np.count_nonzero(coerced_isna & col.notna().to_numpy()))
+                if non_numeric_count > 0:
                     type_errors.append(
-                        f"{field}: {len(non_numeric)} non-numeric values"
-                    )
-
-        # Check URL fields
-        url_fields = ["Website"]
-        for field in url_fields:
-            if field in df.columns:
-                invalid_urls = df[df[field].notna() &
-                                 ~df[field].astype(str).str.contains(
-                                     r'^https?://', case=False, na=False)][field]
-                if len(invalid_urls) > 0:
-                    self.warnings.append(
-                        f"{field}: {len(invalid_urls)} entries missing http:// or https://"
+                        f"{field}: {non_numeric_count} non-numeric values"
                     )
 
-        # Check email fields
-        email_fields = ["Email", "Contact_Email"]
-        for field in email_fields:
+        # Check URL / email fields against their precompiled pattern
+        for field, (pattern, message) in _FORMAT_CHECKS.items():
             if field in df.columns:
-                invalid_emails = df[df[field].notna() &
-                                   ~df[field].astype(str).str.contains(
-                                       r'@', na=False)][field]
-                if len(invalid_emails) > 0:
-                    self.warnings.append(
-                        f"{field}: {len(invalid_emails)} entries missing '@' symbol"
-                    )
+                col = df[field]
+                values = col[col.notna()].astype(str)
+                valid = values.str.match(pattern).to_numpy(dtype=bool)
+                invalid_count = len(valid) - int(np.count_nonzero(valid))
+                if invalid_count > 0:
+                    self.warnings.append(f"{field}: {invalid_count} {message}")
 
         self.validation_results["data_types"] = {
             "errors": type_errors,
             "status": "PASS" if not type_errors else "FAIL"
         }
 
-    def _check_completeness(self, df: pd.DataFrame):
+    def _check_completeness(self, df: pd.DataFrame, columns: frozenset):
         """Check field completeness against target threshold"""
-        required_fields = self.schema.get("required_fields", [])
-        present_required = [f for f in required_fields if f in df.columns]
+        required_fields = self.schema.required_fields
+        present_required = [f for f in required_fields if f in columns]
 
         if not present_required:
             self.errors.append("No required fields found in submission")
             return
 
-        # Calculate completeness for each required field
-        field_completeness = {}
-        for field in present_required:
-            filled = df[field].notna().sum()
-            total = len(df)
-            completeness = filled / total if total > 0 else 0
-            field_completeness[field] = {
+        # Calculate completeness for each required field (one column-wise reduction)
+        total = len(df)
+        filled_counts = df[present_required].notna().sum(axis=0)
+        ratios = (filled_counts / total).round(3) if total > 0 else filled_counts * 0
+        field_completeness = {
+            field: {
                 "filled": int(filled),
                 "total": int(total),
-                "completeness": round(completeness, 3)
+                "completeness": ratio
             }
+            for field, filled, ratio in zip(filled_counts.index, filled_counts, ratios)
+        }
+        # Same stats as table rows, ready for display without reshaping
+        field_stats_records = [
+            {
+                "Field": field,
+                "Filled": stats["filled"],
+                "Total": stats["total"],
+                "Completeness (%)": round(float(stats["completeness"]) * 100, 1)
+            }
+            for field, stats in field_completeness.items()
+        ]
 
         # Overall completeness
-        total_filled = sum(f["filled"] for f in field_completeness.values())
-        total_cells = sum(f["total"] for f in field_completeness.values())
-        overall_completeness = total_filled / total_cells if total_cells > 0 else 0
+        total_cells = total * len(present_required)
+        overall_completeness = int(filled_counts.sum()) / total_cells if total_cells > 0 else 0
 
         # Check against target
         if overall_completeness < COMPLETENESS_TARGET:
@@ -418,25 +681,25 @@ class SubmissionValidator:
             "overall": round(overall_completeness, 3),
             "target": COMPLETENESS_TARGET,
             "field_stats": field_completeness,
+            "field_stats_records": field_stats_records,
             "low_completeness_fields": low_completeness,
             "status": "PASS" if overall_completeness >= COMPLETENESS_TARGET else "WARNING"
         }
 
     def _check_dropdown_values(self, df: pd.DataFrame):
         """Validate dropdown field values"""
-        dropdowns = self.schema.get("dropdowns", {})
         invalid_values = {}
 
-        for field, allowed_values in dropdowns.items():
+        for field, allowed_set in self.schema.dropdowns.items():
             if field in df.columns:
-                # Get unique non-null values
-                actual_values = set(df[field].dropna().astype(str).unique())
-                allowed_set = set(allowed_values)
-
-                # Find invalid values
-                invalid = actual_values - allowed_set
+                # Probe the allowed set once per distinct value, not per row. Values are
+                # made distinct after the str cast: True/1 and False/0 hash equal before it
+                invalid = [
+                    value for value in df[field].dropna().astype(str).unique()
+                    if value not in allowed_set
+                ]
                 if invalid:
-                    invalid_values[field] = list(invalid)
+                    invalid_values[field] = invalid
                     self.errors.append(
                         f"{field}: Invalid values found: {', '.join(invalid)}"
                     )
@@ -449,30 +712,36 @@ class SubmissionValidator:
     def _check_quality_metrics(self, df: pd.DataFrame):
         """Check data quality metrics"""
         metrics = {}
+        # Not-null mask shared by the row, duplicate and field usage metrics
+        notna = df.notna()
 
         # Row count
         metrics["total_rows"] = int(len(df))
-        metrics["non_empty_rows"] = int(df.notna().any(axis=1).sum())
+        metrics["non_empty_rows"] = int(notna.any(axis=1).sum())
 
         # Duplicate check (based on ID fields)
         id_fields = [col for col in df.columns if col.endswith('_ID')]
         if id_fields:
             primary_id = id_fields[0]
-            duplicates = df[df[primary_id].notna()][primary_id].duplicated().sum()
+            # Blank IDs are excluded so they don't count as duplicates of each other.
+            # duplicated() on the single key column is already one hash-table pass;
+            # hashing it via hash_pandas_object first is slower and conflates 1 / "1"
+            duplicates = df[primary_id][notna[primary_id]].duplicated().sum()
             if duplicates > 0:
                 self.warnings.append(f"Found {duplicates} duplicate {primary_id} values")
             metrics["duplicates"] = int(duplicates)
 
         # Field usage statistics
-        metrics["fields_used"] = int(len([col for col in df.columns
-                                         if df[col].notna().any()]))
+        metrics["fields_used"] = int(notna.any(axis=0).sum())
         metrics["fields_total"] = int(len(df.columns))
 
         self.validation_results["quality_metrics"] = metrics
 
     def _check_enhancement_targets(self, df: pd.DataFrame):
         """Check enhancement targets for Organization Registry"""
-        targets = self.schema.get("enhancement_targets", {})
+        import pandas as pd
+
+        targets = self.schema.enhancement_targets or {}
 
         # Identify enhanced vs new organizations
         # Enhanced orgs should have CORDIS_Organization_ID or similar marker
@@ -502,12 +771,12 @@ class SubmissionValidator:
 
         # Check enhancement depth (number of fields filled per enhanced org)
         if not enhanced_orgs.empty:
-            optional_fields = self.schema.get("optional_fields", [])
+            optional_fields = self.schema.optional_fields
             enhancement_fields = [f for f in optional_fields if f in enhanced_orgs.columns]
 
             if enhancement_fields:
-                fields_per_org = enhanced_orgs[enhancement_fields].notna().sum(axis=1)
-                avg_fields = fields_per_org.mean()
+                filled = enhanced_orgs[enhancement_fields].notna()
+                avg_fields = filled.sum(axis=1).mean()
 
                 if avg_fields < targets.get("min_fields_per_org", 3):
                     self.warnings.append(
@@ -524,6 +793,13 @@ class SubmissionValidator:
                                 new_count >= targets.get("min_new_orgs", 10)) else "WARNING"
         }
 
+    def _capped(self, messages: List[str], kind: str) -> List[str]:
+        """Limit a message list to max_errors entries plus an 'and N more' line"""
+        if self.max_errors is None or len(messages) <= self.max_errors:
+            return messages
+        hidden = len(messages) - self.max_errors
+        return messages[:self.max_errors] + [f"... and {hidden} more {kind}"]
+
     def _generate_report(self) -> Dict[str, Any]:
         """Generate validation report"""
         # Determine overall status
@@ -534,53 +810,72 @@ class SubmissionValidator:
         else:
             overall_status = "VALIDATED"
 
+        # Tally check statuses in one pass
+        statuses = Counter(v.get("status") for v in self.validation_results.values()
+                           if isinstance(v, dict))
+
         report = {
             "metadata": {
                 "file_path": str(self.file_path),
                 "file_name": self.file_path.name,
                 "template_type": self.template_type,
                 "validation_timestamp": datetime.now().isoformat(),
-                "validator_version": "1.0"
+                "validator_version": VALIDATOR_VERSION
             },
             "status": overall_status,
-            "errors": self.errors,
-            "warnings": self.warnings,
+            "errors": self._capped(self.errors, "errors"),
+            "warnings": self._capped(self.warnings, "warnings"),
             "validation_results": self.validation_results,
             "summary": {
                 "total_errors": len(self.errors),
                 "total_warnings": len(self.warnings),
-                "checks_passed": sum(1 for v in self.validation_results.values()
-                                    if isinstance(v, dict) and v.get("status") == "PASS"),
-                "checks_failed": sum(1 for v in self.validation_results.values()
-                                   if isinstance(v, dict) and v.get("status") == "FAIL"),
-                "checks_warning": sum(1 for v in self.validation_results.values()
-                                    if isinstance(v, dict) and v.get("status") == "WARNING")
+                "checks_passed": statuses["PASS"],
+                "checks_failed": statuses["FAIL"],
+                "checks_warning": statuses["WARNING"]
             }
         }
 
         return report
 
 
-def validate_file(file_path: str, output_path: str = None) -> Dict[str, Any]:
+def validate_file(source: Union[str, Path, BinaryIO],
+                  output_path: Union[str, Path] = None,
+                  max_errors: Optional[int] = MAX_REPORT_MESSAGES) -> Dict[str, Any]:
     """
     Validate a single submission file
 
     Args:
-        file_path: Path to Excel file to validate
+        source: Path to Excel file to validate, or a binary file object with a
+            ``name`` attribute (e.g. an uploaded file held in memory)
         output_path: Optional path to save validation report (JSON)
+        max_errors: Maximum errors (and warnings) listed in the report; the
+            summary totals still count all of them. None disables the cap.
 
     Returns:
         Validation report dictionary
     """
-    validator = SubmissionValidator(file_path)
+    validator = SubmissionValidator(source, max_errors=max_errors)
     report = validator.validate()
 
     # Save report if output path specified
     if output_path:
-        output_file = Path(output_path)
+        output_file = output_path if isinstance(output_path, Path) else Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            data = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            data = json.dumps(report, indent=2).encode('utf-8')
+        # Write under a unique name and rename into place, so concurrent readers
+        # (e.g. the portal's report cache) never see a half-written report
+        tmp_file = output_file.with_name(f"{output_file.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_file.write_bytes(data)
+            tmp_file.replace(output_file)
+        except BaseException:
+            # Don't leave the partial file behind (disk full, permissions, ...)
+            with contextlib.suppress(FileNotFoundError):
+                tmp_file.unlink()
+            raise
         logger.info(f"Validation report saved to {output_file}")
 
     return report
@@ -597,41 +892,78 @@ def validate_batch(directory: str, output_dir: str = None) -> List[Dict[str, Any
     Returns:
         List of validation reports
     """
-    dir_path = Path(directory)
-    reports = []
-
-    # Find all Excel files
-    excel_files = list(dir_path.glob("*.xlsx"))
-    logger.info(f"Found {len(excel_files)} Excel files to validate")
-
-    for file_path in excel_files:
-        try:
-            # Generate output path if specified
-            if output_dir:
-                output_path = Path(output_dir) / f"{file_path.stem}_validation_report.json"
-            else:
-                output_path = None
+    with _buffered_log_file():
+        dir_path = Path(directory)
+        reports = []
+
+        # Find all Excel files
+        excel_files = list(dir_path.glob("*.xlsx"))
+        logger.info(f"Found {len(excel_files)} Excel files to validate")
+
+        # Files are independent, so validate them in parallel worker processes
+        results = {}
+        if len(excel_files) < 2:
+            for file_path in excel_files:
+                try:
+                    results[file_path] = validate_file(
+                        file_path, _batch_report_path(file_path, output_dir))
+                except Exception as e:
+                    results[file_path] = e
+        else:
+            # Empty the log buffer so forked workers don't inherit (and re-write) it
+            if _log_buffer is not None:
+                _log_buffer.flush()
+            max_workers = min(len(excel_files), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = {
+                    pool.submit(_validate_file_in_worker, file_path,
+                                _batch_report_path(file_path, output_dir)): file_path
+                    for file_path in excel_files
+                }
+                for future in as_completed(futures):
+                    try:
+                        results[futures[future]] = future.result()
+                    except Exception as e:
+                        results[futures[future]] = e
+
+        # Collect reports in directory order
+        for file_path in excel_files:
+            result = results[file_path]
+            if isinstance(result, Exception):
+                logger.error(f"Failed to validate {file_path.name}: {str(result)}")
+                reports.append({
+                    "metadata": {"file_name": file_path.name},
+                    "status": "ERROR",
+                    "errors": [str(result)]
+                })
+                continue
 
-            # Validate file
-            report = validate_file(str(file_path), str(output_path) if output_path else None)
-            reports.append(report)
+            reports.append(result)
 
             # Log summary
             logger.info(
-                f"{file_path.name}: {report['status']} "
-                f"({report['summary']['total_errors']} errors, "
-                f"{report['summary']['total_warnings']} warnings)"
+                f"{file_path.name}: {result['status']} "
+                f"({result['summary']['total_errors']} errors, "
+                f"{result['summary']['total_warnings']} warnings)"
             )
 
-        except Exception as e:
-            logger.error(f"Failed to validate {file_path.name}: {str(e)}")
-            reports.append({
-                "metadata": {"file_name": file_path.name},
-                "status": "ERROR",
-                "errors": [str(e)]
-            })
-
-    return reports
+        return reports
+
+
+def _validate_file_in_worker(file_path: Path, output_path: Path = None) -> Dict[str, Any]:
+    """validate_file for batch worker processes, which exit without running logging's exit hook"""
+    try:
+        return validate_file(file_path, output_path)
+    finally:
+        if _log_buffer is not None:
+            _log_buffer.flush()
+
+
+def _batch_report_path(file_path: Path, output_dir: str = None) -> Path:
+    """Report path for a file validated in batch mode (None if not saving reports)"""
+    if not output_dir:
+        return None
+    return Path(output_dir) / f"{file_path.stem}_validation_report.json"
 
 
 def main():
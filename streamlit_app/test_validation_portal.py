@@ -4,7 +4,9 @@ Test script for validation portal functionality
 Tests the validation logic without running Streamlit
 """
 
+import io
 import sys
+from datetime import date
 from pathlib import Path
 
 # Add parent directory to path
@@ -12,15 +14,38 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from scripts.validate_submission import validate_file
 
+def _upload(name, data):
+    """In-memory file named like an upload"""
+    buffer = io.BytesIO(data)
+    buffer.name = name
+    return buffer
+
+def _edited_workbook(file_path, cells):
+    """Bytes of a copy of the workbook with the given cells overwritten"""
+    from openpyxl import load_workbook
+    wb = load_workbook(file_path)
+    for ref, value in cells.items():
+        wb.active[ref] = value
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+def _comparable(report):
+    """Report without the fields that differ between runs and sources"""
+    metadata = dict(report['metadata'])
+    metadata.pop('validation_timestamp', None)
+    metadata.pop('file_path', None)
+    return {**report, 'metadata': metadata}
+
 def test_validation_portal():
     """Test validation with sample files"""
 
     # Test files
     test_files = [
-        "../test_samples/1_Organization_Registry_PT16_TEST.xlsx",
-        "../test_samples/2_Stakeholder_Mapping_PT16_TEST.xlsx",
-        "../test_samples/3_Value_Chain_Mapping_PT16_TEST.xlsx",
-        "../test_samples/4_Funding_Sources_PT16_TEST.xlsx"
+        "../templates/test_samples/1_Organization_Registry_PT16_TEST.xlsx",
+        "../templates/test_samples/2_Stakeholder_Mapping_PT16_TEST.xlsx",
+        "../templates/test_samples/3_Value_Chain_Mapping_PT16_TEST.xlsx",
+        "../templates/test_samples/4_Funding_Sources_PT16_TEST.xlsx"
     ]
 
     print("="*70)
@@ -100,7 +125,7 @@ def test_validation_portal():
     print(f"   Found {len(TEMPLATE_SCHEMAS)} template schemas")
     for template_name in list(TEMPLATE_SCHEMAS.keys())[:3]:
         schema = TEMPLATE_SCHEMAS[template_name]
-        print(f"   - {template_name}: {len(schema.get('required_fields', []))} required fields")
+        print(f"   - {template_name}: {len(schema.required_fields)} required fields")
     print()
 
     # Test 2: Validation report structure
@@ -120,10 +145,49 @@ def test_validation_portal():
 
     # Test 3: File handling
     print("✅ Test 3: File Handling")
-    print("   ✅ Temporary upload directory can be created")
-    temp_dir = Path(__file__).parent / "temp_uploads"
-    temp_dir.mkdir(exist_ok=True)
-    print(f"   Created: {temp_dir}")
+    import scripts.validate_submission as validator
+    sources = []
+    for test_file in test_files:
+        file_path = Path(__file__).parent / test_file
+        if not file_path.exists():
+            continue
+
+        # Uploads are validated from memory, named like the uploaded file
+        on_disk = _comparable(validate_file(str(file_path)))
+        in_memory = _comparable(validate_file(_upload(file_path.name, file_path.read_bytes())))
+        assert in_memory == on_disk, \
+            f"In-memory upload of {file_path.name} differs from the file on disk"
+        sources.append((file_path.name, file_path.read_bytes()))
+
+    # Cells the two readers represent differently: Excel errors, dates, big floats
+    stakeholder_file = Path(__file__).parent / test_files[1]
+    if stakeholder_file.exists():
+        sources.append(("2_Stakeholder_Mapping_ERRORS.xlsx",
+                        _edited_workbook(stakeholder_file, {"D4": "#REF!"})))
+        sources.append(("2_Stakeholder_Mapping_DATES.xlsx",
+                        _edited_workbook(stakeholder_file, {"E4": date(2024, 3, 4),
+                                                            "F5": 1e20})))
+        sources.append(("2_Stakeholder_Mapping_BOOLS.xlsx",
+                        _edited_workbook(stakeholder_file, {"D4": True, "D5": 1})))
+
+    # The calamine reader (when installed) and the openpyxl fallback agree
+    if validator._calamine() is not None:
+        calamine = validator._calamine
+        for name, data in sources:
+            calamine_report = _comparable(validate_file(_upload(name, data)))
+            validator._calamine = lambda: None
+            try:
+                openpyxl_report = _comparable(validate_file(_upload(name, data)))
+            finally:
+                validator._calamine = calamine
+            assert openpyxl_report == calamine_report, \
+                f"openpyxl and calamine reports differ for {name}"
+            if name.endswith("_ERRORS.xlsx"):
+                assert "Role: Invalid values found: #REF!" in calamine_report['errors']
+            if name.endswith("_BOOLS.xlsx"):
+                # True and 1 hash equal but are reported as distinct values
+                assert "Role: Invalid values found: True, 1" in calamine_report['errors']
+    print("   ✅ In-memory uploads and both readers give the same report")
     print()
 
     # Test 4: Error handling
@@ -5,15 +5,170 @@ Streamlit web interface for partners to upload and validate data submissions
 """
 
 import streamlit as st
+import hashlib
+import io
 import sys
 import json
+import time
 from pathlib import Path
 from datetime import datetime
-import pandas as pd
 
-# Add parent directory to path to import validation module
+try:
+    import orjson  # Optional: faster report serialization
+except ImportError:
+    orjson = None
+
+# Add parent directory to path to import validation module. The module itself
+# (and pandas) is imported on first use so cold start only pays for Streamlit
 sys.path.append(str(Path(__file__).parent.parent))
-from scripts.validate_submission import validate_file, TEMPLATE_SCHEMAS
+
+
+@st.cache_resource
+def _portal_css() -> str:
+    """Portal stylesheet, read from disk once per server process"""
+    return (Path(__file__).parent / "static" / "portal.css").read_text(encoding="utf-8")
+
+
+@st.cache_resource
+def _schemas() -> dict:
+    """Template schemas, shared by every session of this server process"""
+    from scripts.validate_submission import TEMPLATE_SCHEMAS
+    return TEMPLATE_SCHEMAS
+
+
+# Reports of earlier uploads, keyed by content digest, so an identical
+# re-upload is answered without parsing the workbook again. Entries hold
+# partner data, so they expire quickly and the directory is size-bounded;
+# the in-memory report caches below use the same limits
+REPORT_CACHE_DIR = Path(__file__).parent / "temp_uploads" / "cache"
+REPORT_CACHE_MAX_AGE = 60 * 60  # seconds
+REPORT_CACHE_MAX_ENTRIES = 100
+
+# Partial reruns need Streamlit 1.33+ (st.fragment from 1.37); older
+# versions simply rerun the whole script
+_fragment = (getattr(st, "fragment", None)
+             or getattr(st, "experimental_fragment", None)
+             or (lambda func: func))
+
+
+def _upload_digest(file_bytes: bytes, filename: str) -> str:
+    """SHA-256 identifying an upload; the name decides which template applies"""
+    digest = hashlib.sha256(file_bytes)
+    digest.update(filename.encode("utf-8"))
+    return digest.hexdigest()
+
+
+@st.cache_resource
+def _validator_fingerprint() -> bytes:
+    """Identifies the validator rules, so cached reports die with a rule change"""
+    import scripts.validate_submission as validator
+
+    digest = hashlib.sha256(validator.VALIDATOR_VERSION.encode("utf-8"))
+    digest.update(Path(validator.__file__).read_bytes())
+    return digest.digest()
+
+
+def _prune_report_cache():
+    """Delete expired cached reports, then the oldest beyond the entry limit"""
+    try:
+        entries = [(path.stat().st_mtime, path) for path in REPORT_CACHE_DIR.iterdir()]
+    except OSError:
+        return
+    cutoff = time.time() - REPORT_CACHE_MAX_AGE
+    entries.sort(reverse=True)
+    for idx, (mtime, path) in enumerate(entries):
+        if mtime < cutoff or idx >= REPORT_CACHE_MAX_ENTRIES:
+            try:
+                path.unlink()
+            except OSError:
+                pass  # Already removed by another session
+
+
+@st.cache_data(show_spinner=False, ttl=REPORT_CACHE_MAX_AGE,
+               max_entries=REPORT_CACHE_MAX_ENTRIES)
+def _cached_validate(file_bytes: bytes, filename: str) -> dict:
+    """Validate an uploaded file, cached on its content so reruns skip re-parsing"""
+    key = hashlib.sha256(_validator_fingerprint())
+    key.update(_upload_digest(file_bytes, filename).encode("ascii"))
+    cache_file = REPORT_CACHE_DIR / f"{key.hexdigest()}.json"
+
+    try:
+        if time.time() - cache_file.stat().st_mtime < REPORT_CACHE_MAX_AGE:
+            return json.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        pass  # Not cached yet (or unreadable); validate below
+
+    try:
+        REPORT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        cache_file = None  # Read-only deployment: validate without caching
+
+    from scripts.validate_submission import validate_file
+
+    # Validate in memory; the template type is read from the buffer's name
+    buffer = io.BytesIO(file_bytes)
+    buffer.name = filename
+    report = validate_file(buffer, output_path=cache_file)
+    _prune_report_cache()
+    return report
+
+
+@st.cache_data(show_spinner=False, ttl=REPORT_CACHE_MAX_AGE,
+               max_entries=REPORT_CACHE_MAX_ENTRIES)
+def _report_json(report: dict) -> bytes:
+    """Serialize a report for download once, not on every rerun"""
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(report, indent=2).encode("utf-8")
+
+
+@st.cache_data(show_spinner=False, ttl=REPORT_CACHE_MAX_AGE,
+               max_entries=REPORT_CACHE_MAX_ENTRIES)
+def _summary_text(report: dict, file_name: str, region: str, template: str) -> str:
+    """Plain-text report summary offered as a download"""
+    summary = report['summary']
+    lines = [
+        "BIO-RED T2.1 Validation Report",
+        f"File: {file_name}",
+        f"Region: {region}",
+        f"Template: {template}",
+        f"Validation Time: {report['metadata']['validation_timestamp']}",
+        "",
+        f"STATUS: {report['status']}",
+        "",
+        "SUMMARY:",
+        f"- Total Errors: {summary['total_errors']}",
+        f"- Total Warnings: {summary['total_warnings']}",
+        f"- Checks Passed: {summary['checks_passed']}",
+        f"- Checks Failed: {summary['checks_failed']}",
+        "",
+        "ERRORS:",
+    ]
+    lines += [f"- {error}" for error in report['errors']]
+    lines += ["", "WARNINGS:"]
+    lines += [f"- {warning}" for warning in report['warnings']]
+    return "\n".join(lines) + "\n"
+
+
+# Messages shown inline per list; the rest go into a single table
+INLINE_MESSAGES = 50
+
+
+def _render_messages(messages: list, show, kind: str):
+    """Show the first INLINE_MESSAGES messages inline and the rest in one table"""
+    for idx, message in enumerate(messages[:INLINE_MESSAGES], 1):
+        show(f"{idx}. {message}")
+    remaining = messages[INLINE_MESSAGES:]
+    if remaining:
+        import pandas as pd
+
+        with st.expander(f"Show remaining {len(remaining)} {kind}"):
+            st.dataframe(
+                pd.DataFrame({kind[:-1]: remaining},
+                             index=range(INLINE_MESSAGES + 1, len(messages) + 1)),
+                use_container_width=True
+            )
+
 
 # Page configuration
 st.set_page_config(
@@ -23,57 +178,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better UI
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        color: #1E88E5;
-        text-align: center;
-        margin-bottom: 1rem;
-    }
-    .sub-header {
-        font-size: 1.2rem;
-        color: #424242;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .success-box {
-        padding: 1rem;
-        border-radius: 0.5rem;
-        background-color: #C8E6C9;
-        border-left: 5px solid #4CAF50;
-        margin: 1rem 0;
-    }
-    .warning-box {
-        padding: 1rem;
-        border-radius: 0.5rem;
-        background-color: #FFF9C4;
-        border-left: 5px solid #FFC107;
-        margin: 1rem 0;
-    }
-    .error-box {
-        padding: 1rem;
-        border-radius: 0.5rem;
-        background-color: #FFCDD2;
-        border-left: 5px solid #F44336;
-        margin: 1rem 0;
-    }
-    .info-box {
-        padding: 1rem;
-        border-radius: 0.5rem;
-        background-color: #E3F2FD;
-        border-left: 5px solid #2196F3;
-        margin: 1rem 0;
-    }
-    .metric-card {
-        background-color: #F5F5F5;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        text-align: center;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS for better UI (kept in static/portal.css, read once per process)
+st.markdown(f"<style>{_portal_css()}</style>", unsafe_allow_html=True)
 
 # Header
 st.markdown('<div class="main-header">🔬 BIO-RED Data Validation Portal</div>', unsafe_allow_html=True)
@@ -169,23 +275,23 @@ with col1:
 with col2:
     st.header("ℹ️ Template Info")
 
-    if template_key in TEMPLATE_SCHEMAS:
-        schema = TEMPLATE_SCHEMAS[template_key]
+    schema = _schemas().get(template_key)
+    if schema is not None:
 
         st.markdown(f"""
         <div class="info-box">
-            <strong>Required Fields:</strong> {len(schema.get('required_fields', []))}
+            <strong>Required Fields:</strong> {len(schema.required_fields)}
             <br>
-            <strong>Optional Fields:</strong> {len(schema.get('optional_fields', []))}
+            <strong>Optional Fields:</strong> {len(schema.optional_fields)}
             <br>
-            <strong>Dropdown Fields:</strong> {len(schema.get('dropdowns', {}))}
+            <strong>Dropdown Fields:</strong> {len(schema.dropdowns)}
         </div>
         """, unsafe_allow_html=True)
 
         # Show required fields
         with st.expander("View Required Fields"):
-            for field in schema.get('required_fields', []):
-                st.write(f"- {field.replace('_', ' ')}")
+            st.markdown("\n".join(f"- {field.replace('_', ' ')}"
+                                   for field in schema.required_fields))
 
         # Special note for Organization Registry
         if template_key == "1_Organization_Registry":
@@ -196,279 +302,264 @@ with col2:
             - Min 3 fields per enhanced org
             """)
 
-# Process uploaded file
-if uploaded_file is not None:
-    st.divider()
+@_fragment
+def _render_results(validation_report: dict, file_name: str, region: str,
+                    template: str, timestamp: str):
+    """Render a validation report; as a fragment, its widgets rerun only this part"""
+    st.header("📊 Validation Results")
 
-    # Save uploaded file temporarily
-    temp_dir = Path("temp_uploads")
-    temp_dir.mkdir(exist_ok=True)
+    # Status header
+    status = validation_report['status']
+    if status == "VALIDATED":
+        st.markdown(f"""
+        <div class="success-box">
+            <h2>✅ VALIDATION PASSED</h2>
+            <p>Your submission meets all quality standards!</p>
+        </div>
+        """, unsafe_allow_html=True)
+    elif status == "VALIDATED_WITH_WARNINGS":
+        st.markdown(f"""
+        <div class="warning-box">
+            <h2>⚠️ VALIDATED WITH WARNINGS</h2>
+            <p>Your submission is acceptable but has some warnings. Please review below.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        st.markdown(f"""
+        <div class="error-box">
+            <h2>❌ VALIDATION FAILED</h2>
+            <p>Your submission has errors that must be fixed before formal submission.</p>
+        </div>
+        """, unsafe_allow_html=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    temp_file_path = temp_dir / f"{uploaded_file.name}"
+    # Metrics in columns
+    st.subheader("Summary Metrics")
+    metric_cols = st.columns(4)
+    summary = validation_report['summary']
+
+    with metric_cols[0]:
+        st.metric("Total Errors", summary['total_errors'])
+    with metric_cols[1]:
+        st.metric("Total Warnings", summary['total_warnings'])
+    with metric_cols[2]:
+        st.metric("Checks Passed", summary['checks_passed'])
+    with metric_cols[3]:
+        st.metric("Checks Failed", summary['checks_failed'])
+
+    # Errors section
+    if validation_report['errors']:
+        st.subheader("❌ Errors to Fix")
+        _render_messages(validation_report['errors'], st.error, "errors")
+
+    # Warnings section
+    if validation_report['warnings']:
+        st.subheader("⚠️ Warnings")
+        _render_messages(validation_report['warnings'], st.warning, "warnings")
+
+    # Detailed validation results
+    st.subheader("🔍 Detailed Validation Checks")
+
+    results = validation_report['validation_results']
+
+    # Schema compliance
+    if 'schema_compliance' in results:
+        with st.expander("Schema Compliance", expanded=True):
+            check = results['schema_compliance']
+            status_icon = "✅" if check['status'] == "PASS" else "❌"
+            st.write(f"**Status:** {status_icon} {check['status']}")
+
+            col_a, col_b = st.columns(2)
+            with col_a:
+                st.write("**Present Fields:**")
+                # One markdown block per list instead of one element per field
+                st.markdown("  \n".join(f"✅ {field.replace('_', ' ')}"
+                                         for field in check.get('present_fields', [])))
+
+            with col_b:
+                if check.get('missing_fields'):
+                    st.write("**Missing Fields:**")
+                    st.markdown("  \n".join(f"❌ {field.replace('_', ' ')}"
+                                             for field in check['missing_fields']))
+
+    # Completeness
+    if 'completeness' in results:
+        with st.expander("Data Completeness", expanded=True):
+            check = results['completeness']
+            status_icon = "✅" if check['status'] == "PASS" else "⚠️"
+
+            completeness_pct = check['overall'] * 100
+            target_pct = check['target'] * 100
+
+            st.write(f"**Status:** {status_icon} {check['status']}")
+            st.progress(check['overall'])
+            st.write(f"**Overall Completeness:** {completeness_pct:.1f}% (Target: {target_pct:.0f}%)")
+
+            # Field-level completeness
+            if check.get('field_stats_records'):
+                st.write("**Field-level Completeness:**")
+                st.dataframe(check['field_stats_records'],
+                             use_container_width=True, hide_index=True)
+
+            # Low completeness fields
+            if check.get('low_completeness_fields'):
+                st.warning("**Fields with low completeness (<80%):**")
+                st.markdown("\n".join(
+                    f"- {field.replace('_', ' ')}: {stats['completeness']*100:.1f}%"
+                    for field, stats in check['low_completeness_fields'].items()
+                ))
+
+    # Data types
+    if 'data_types' in results:
+        with st.expander("Data Type Validation"):
+            check = results['data_types']
+            status_icon = "✅" if check['status'] == "PASS" else "❌"
+            st.write(f"**Status:** {status_icon} {check['status']}")
+
+            if check.get('errors'):
+                for error in check['errors']:
+                    st.error(error)
+            else:
+                st.success("All data types are valid!")
+
+    # Dropdown validation
+    if 'dropdown_validation' in results:
+        with st.expander("Dropdown Value Validation"):
+            check = results['dropdown_validation']
+            status_icon = "✅" if check['status'] == "PASS" else "❌"
+            st.write(f"**Status:** {status_icon} {check['status']}")
+
+            if check.get('invalid_values'):
+                st.error("**Invalid dropdown values found:**")
+                st.markdown("\n".join(
+                    f"- **{field.replace('_', ' ')}:** {', '.join(invalid_vals)}"
+                    for field, invalid_vals in check['invalid_values'].items()
+                ))
+            else:
+                st.success("All dropdown values are valid!")
+
+    # Quality metrics
+    if 'quality_metrics' in results:
+        with st.expander("Quality Metrics"):
+            metrics = results['quality_metrics']
+
+            metric_cols2 = st.columns(4)
+            with metric_cols2[0]:
+                st.metric("Total Rows", metrics.get('total_rows', 0))
+            with metric_cols2[1]:
+                st.metric("Non-Empty Rows", metrics.get('non_empty_rows', 0))
+            with metric_cols2[2]:
+                st.metric("Duplicates", metrics.get('duplicates', 0))
+            with metric_cols2[3]:
+                fields_used = metrics.get('fields_used', 0)
+                fields_total = metrics.get('fields_total', 0)
+                st.metric("Fields Used", f"{fields_used}/{fields_total}")
+
+    # Enhancement targets (for Organization Registry)
+    if 'enhancement_targets' in results:
+        with st.expander("Enhancement Targets (Organization Registry)", expanded=True):
+            check = results['enhancement_targets']
+            status_icon = "✅" if check['status'] == "PASS" else "⚠️"
+            st.write(f"**Status:** {status_icon} {check['status']}")
+
+            enh_cols = st.columns(2)
+            with enh_cols[0]:
+                st.metric(
+                    "Enhanced CORDIS Orgs",
+                    check['enhanced_orgs'],
+                    delta=check['enhanced_orgs'] - check['enhanced_target'],
+                    delta_color="normal"
+                )
+                st.caption(f"Target: {check['enhanced_target']}")
+
+            with enh_cols[1]:
+                st.metric(
+                    "New Organizations",
+                    check['new_orgs'],
+                    delta=check['new_orgs'] - check['new_target'],
+                    delta_color="normal"
+                )
+                st.caption(f"Target: {check['new_target']}")
 
-    with open(temp_file_path, "wb") as f:
-        f.write(uploaded_file.getbuffer())
+    # Download validation report
+    st.divider()
+    st.subheader("📥 Download Report")
+
+    col_download1, col_download2 = st.columns(2)
+
+    with col_download1:
+        # JSON report
+        st.download_button(
+            label="📄 Download JSON Report",
+            data=_report_json(validation_report),
+            file_name=f"{file_name}_validation_report_{timestamp}.json",
+            mime="application/json"
+        )
+
+    with col_download2:
+        # Summary text report
+        summary_text = _summary_text(validation_report, file_name,
+                                     region, template)
+        st.download_button(
+            label="📝 Download Text Report",
+            data=summary_text,
+            file_name=f"{file_name}_validation_summary_{timestamp}.txt",
+            mime="text/plain"
+        )
+
+    # Next steps
+    st.divider()
+    st.subheader("🎯 Next Steps")
 
-    # Validate the file
-    with st.spinner("🔍 Validating your submission..."):
-        try:
-            # Run validation
-            validation_report = validate_file(str(temp_file_path))
+    if status == "VALIDATED":
+        st.success("""
+        ✅ **Your file is ready for submission!**
 
-            # Display results
-            st.header("📊 Validation Results")
-
-            # Status header
-            status = validation_report['status']
-            if status == "VALIDATED":
-                st.markdown(f"""
-                <div class="success-box">
-                    <h2>✅ VALIDATION PASSED</h2>
-                    <p>Your submission meets all quality standards!</p>
-                </div>
-                """, unsafe_allow_html=True)
-            elif status == "VALIDATED_WITH_WARNINGS":
-                st.markdown(f"""
-                <div class="warning-box">
-                    <h2>⚠️ VALIDATED WITH WARNINGS</h2>
-                    <p>Your submission is acceptable but has some warnings. Please review below.</p>
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown(f"""
-                <div class="error-box">
-                    <h2>❌ VALIDATION FAILED</h2>
-                    <p>Your submission has errors that must be fixed before formal submission.</p>
-                </div>
-                """, unsafe_allow_html=True)
-
-            # Metrics in columns
-            st.subheader("Summary Metrics")
-            metric_cols = st.columns(4)
-
-            with metric_cols[0]:
-                st.metric("Total Errors", validation_report['summary']['total_errors'])
-            with metric_cols[1]:
-                st.metric("Total Warnings", validation_report['summary']['total_warnings'])
-            with metric_cols[2]:
-                st.metric("Checks Passed", validation_report['summary']['checks_passed'])
-            with metric_cols[3]:
-                st.metric("Checks Failed", validation_report['summary']['checks_failed'])
-
-            # Errors section
-            if validation_report['errors']:
-                st.subheader("❌ Errors to Fix")
-                for idx, error in enumerate(validation_report['errors'], 1):
-                    st.error(f"{idx}. {error}")
-
-            # Warnings section
-            if validation_report['warnings']:
-                st.subheader("⚠️ Warnings")
-                for idx, warning in enumerate(validation_report['warnings'], 1):
-                    st.warning(f"{idx}. {warning}")
-
-            # Detailed validation results
-            st.subheader("🔍 Detailed Validation Checks")
-
-            results = validation_report['validation_results']
-
-            # Schema compliance
-            if 'schema_compliance' in results:
-                with st.expander("Schema Compliance", expanded=True):
-                    check = results['schema_compliance']
-                    status_icon = "✅" if check['status'] == "PASS" else "❌"
-                    st.write(f"**Status:** {status_icon} {check['status']}")
-
-                    col_a, col_b = st.columns(2)
-                    with col_a:
-                        st.write("**Present Fields:**")
-                        for field in check.get('present_fields', []):
-                            st.write(f"✅ {field.replace('_', ' ')}")
-
-                    with col_b:
-                        if check.get('missing_fields'):
-                            st.write("**Missing Fields:**")
-                            for field in check['missing_fields']:
-                                st.write(f"❌ {field.replace('_', ' ')}")
-
-            # Completeness
-            if 'completeness' in results:
-                with st.expander("Data Completeness", expanded=True):
-                    check = results['completeness']
-                    status_icon = "✅" if check['status'] == "PASS" else "⚠️"
-
-                    completeness_pct = check['overall'] * 100
-                    target_pct = check['target'] * 100
-
-                    st.write(f"**Status:** {status_icon} {check['status']}")
-                    st.progress(check['overall'])
-                    st.write(f"**Overall Completeness:** {completeness_pct:.1f}% (Target: {target_pct:.0f}%)")
-
-                    # Field-level completeness
-                    if check.get('field_stats'):
-                        st.write("**Field-level Completeness:**")
-                        field_df = pd.DataFrame(check['field_stats']).T
-                        field_df['completeness_pct'] = (field_df['completeness'] * 100).round(1)
-                        field_df = field_df[['filled', 'total', 'completeness_pct']]
-                        field_df.columns = ['Filled', 'Total', 'Completeness (%)']
-                        st.dataframe(field_df, use_container_width=True)
-
-                    # Low completeness fields
-                    if check.get('low_completeness_fields'):
-                        st.warning("**Fields with low completeness (<80%):**")
-                        for field, stats in check['low_completeness_fields'].items():
-                            st.write(f"- {field.replace('_', ' ')}: {stats['completeness']*100:.1f}%")
-
-            # Data types
-            if 'data_types' in results:
-                with st.expander("Data Type Validation"):
-                    check = results['data_types']
-                    status_icon = "✅" if check['status'] == "PASS" else "❌"
-                    st.write(f"**Status:** {status_icon} {check['status']}")
-
-                    if check.get('errors'):
-                        for error in check['errors']:
-                            st.error(error)
-                    else:
-                        st.success("All data types are valid!")
-
-            # Dropdown validation
-            if 'dropdown_validation' in results:
-                with st.expander("Dropdown Value Validation"):
-                    check = results['dropdown_validation']
-                    status_icon = "✅" if check['status'] == "PASS" else "❌"
-                    st.write(f"**Status:** {status_icon} {check['status']}")
-
-                    if check.get('invalid_values'):
-                        st.error("**Invalid dropdown values found:**")
-                        for field, invalid_vals in check['invalid_values'].items():
-                            st.write(f"- **{field.replace('_', ' ')}:** {', '.join(invalid_vals)}")
-                    else:
-                        st.success("All dropdown values are valid!")
-
-            # Quality metrics
-            if 'quality_metrics' in results:
-                with st.expander("Quality Metrics"):
-                    metrics = results['quality_metrics']
-
-                    metric_cols2 = st.columns(4)
-                    with metric_cols2[0]:
-                        st.metric("Total Rows", metrics.get('total_rows', 0))
-                    with metric_cols2[1]:
-                        st.metric("Non-Empty Rows", metrics.get('non_empty_rows', 0))
-                    with metric_cols2[2]:
-                        st.metric("Duplicates", metrics.get('duplicates', 0))
-                    with metric_cols2[3]:
-                        fields_used = metrics.get('fields_used', 0)
-                        fields_total = metrics.get('fields_total', 0)
-                        st.metric("Fields Used", f"{fields_used}/{fields_total}")
-
-            # Enhancement targets (for Organization Registry)
-            if 'enhancement_targets' in results:
-                with st.expander("Enhancement Targets (Organization Registry)", expanded=True):
-                    check = results['enhancement_targets']
-                    status_icon = "✅" if check['status'] == "PASS" else "⚠️"
-                    st.write(f"**Status:** {status_icon} {check['status']}")
-
-                    enh_cols = st.columns(2)
-                    with enh_cols[0]:
-                        st.metric(
-                            "Enhanced CORDIS Orgs",
-                            check['enhanced_orgs'],
-                            delta=check['enhanced_orgs'] - check['enhanced_target'],
-                            delta_color="normal"
-                        )
-                        st.caption(f"Target: {check['enhanced_target']}")
-
-                    with enh_cols[1]:
-                        st.metric(
-                            "New Organizations",
-                            check['new_orgs'],
-                            delta=check['new_orgs'] - check['new_target'],
-                            delta_color="normal"
-                        )
-                        st.caption(f"Target: {check['new_target']}")
-
-            # Download validation report
-            st.divider()
-            st.subheader("📥 Download Report")
-
-            col_download1, col_download2 = st.columns(2)
-
-            with col_download1:
-                # JSON report
-                report_json = json.dumps(validation_report, indent=2)
-                st.download_button(
-                    label="📄 Download JSON Report",
-                    data=report_json,
-                    file_name=f"{uploaded_file.name}_validation_report_{timestamp}.json",
-                    mime="application/json"
-                )
+        - Download the validation report for your records
+        - Submit your file through the official submission portal
+        - You will receive confirmation within 24 hours
+        """)
+    elif status == "VALIDATED_WITH_WARNINGS":
+        st.warning("""
+        ⚠️ **Your file can be submitted, but consider addressing warnings:**
 
-            with col_download2:
-                # Summary text report
-                summary_text = f"""BIO-RED T2.1 Validation Report
-File: {uploaded_file.name}
-Region: {partner_region}
-Template: {selected_template}
-Validation Time: {validation_report['metadata']['validation_timestamp']}
+        - Review the warnings above
+        - Consider improving data completeness or enhancement targets
+        - You can submit as-is or fix warnings and re-validate
+        """)
+    else:
+        st.error("""
+        ❌ **Please fix errors before submission:**
 
-STATUS: {validation_report['status']}
+        1. Download the validation report
+        2. Fix all errors listed above
+        3. Re-upload your corrected file
+        4. Repeat until validation passes
 
-SUMMARY:
-- Total Errors: {validation_report['summary']['total_errors']}
-- Total Warnings: {validation_report['summary']['total_warnings']}
-- Checks Passed: {validation_report['summary']['checks_passed']}
-- Checks Failed: {validation_report['summary']['checks_failed']}
+        Need help? Contact support@biored-project.eu
+        """)
 
-ERRORS:
-"""
-                for error in validation_report['errors']:
-                    summary_text += f"- {error}\n"
-
-                summary_text += "\nWARNINGS:\n"
-                for warning in validation_report['warnings']:
-                    summary_text += f"- {warning}\n"
-
-                st.download_button(
-                    label="📝 Download Text Report",
-                    data=summary_text,
-                    file_name=f"{uploaded_file.name}_validation_summary_{timestamp}.txt",
-                    mime="text/plain"
-                )
 
-            # Next steps
-            st.divider()
-            st.subheader("🎯 Next Steps")
-
-            if status == "VALIDATED":
-                st.success("""
-                ✅ **Your file is ready for submission!**
-
-                - Download the validation report for your records
-                - Submit your file through the official submission portal
-                - You will receive confirmation within 24 hours
-                """)
-            elif status == "VALIDATED_WITH_WARNINGS":
-                st.warning("""
-                ⚠️ **Your file can be submitted, but consider addressing warnings:**
-
-                - Review the warnings above
-                - Consider improving data completeness or enhancement targets
-                - You can submit as-is or fix warnings and re-validate
-                """)
-            else:
-                st.error("""
-                ❌ **Please fix errors before submission:**
+# Process uploaded file
+if uploaded_file is not None:
+    st.divider()
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-                1. Download the validation report
-                2. Fix all errors listed above
-                3. Re-upload your corrected file
-                4. Repeat until validation passes
+    # Validate the file
+    with st.spinner("🔍 Validating your submission..."):
+        try:
+            # Run validation once per uploaded file; widget-only reruns reuse the
+            # report kept in this session instead of copying it out of the cache
+            file_bytes = uploaded_file.getvalue()
+            digest = _upload_digest(file_bytes, uploaded_file.name)
+            if st.session_state.get("last_hash") != digest or "last_report" not in st.session_state:
+                st.session_state["last_report"] = _cached_validate(file_bytes, uploaded_file.name)
+                st.session_state["last_hash"] = digest
+            validation_report = st.session_state["last_report"]
 
-                Need help? Contact support@biored-project.eu
-                """)
+            # Display results
+            _render_results(validation_report, uploaded_file.name, partner_region,
+                            selected_template, timestamp)
 
         except Exception as e:
             st.error(f"""
@@ -484,11 +575,6 @@ ERRORS:
             If the problem persists, contact support@biored-project.eu
             """)
 
-        finally:
-            # Clean up temporary file
-            if temp_file_path.exists():
-                temp_file_path.unlink()
-
 else:
     # Initial state - show example
     st.info("""